@@ -81,6 +81,13 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            # Take the write lock when a transaction starts so atomic blocks
+            # that read then write (e.g. shift signup) are serialized
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
@@ -139,6 +146,7 @@ LOGOUT_REDIRECT_URL = 'home'
 # Replace these with your actual Stripe keys
 STRIPE_PUBLISHABLE_KEY = os.environ['STRIPE_PUBLISHABLE_KEY']
 STRIPE_SECRET_KEY = os.environ['STRIPE_SECRET_KEY']
+STRIPE_WEBHOOK_SECRET = os.environ.get('STRIPE_WEBHOOK_SECRET', '')
 
 # Background tasks configuration
 # Uses ImmediateBackend in debug (runs synchronously), DatabaseBackend in production
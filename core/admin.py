@@ -1,9 +1,18 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import F
+from django.urls import reverse
+from django.utils.html import format_html
 
+from .forms import AdminChangeForm, AdminCreationForm
 from .models import Event, Order, Role, Shift, ShiftAssignment, TicketType, Transfer, User
 
 
+def _is_changelist(request):
+    url_name = getattr(request.resolver_match, 'url_name', None) or ''
+    return url_name.endswith('_changelist')
+
+
 class TicketTypeInline(admin.TabularInline):
     model = TicketType
     extra = 1
@@ -16,6 +25,16 @@ class EventAdmin(admin.ModelAdmin):
     search_fields = ('name',)
     ordering = ('-start_date',)
     inlines = [TicketTypeInline]
+    actions = ['make_active']
+
+    @admin.action(description='Make selected event active')
+    def make_active(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, 'Select exactly one event to make active.', messages.ERROR)
+            return
+        event = queryset.get()
+        event.activate()
+        self.message_user(request, f'{event} is now the active event.', messages.SUCCESS)
 
 
 @admin.register(TicketType)
@@ -23,14 +42,25 @@ class TicketTypeAdmin(admin.ModelAdmin):
     list_display = ('label', 'event', 'name', 'price', 'max_per_user')
     list_filter = ('event',)
     search_fields = ('label', 'name')
+    show_full_result_count = False
     ordering = ('event', 'name')
+    list_select_related = ('event',)
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _is_changelist(request):
+            qs = qs.defer('description', 'stripe_price_id')
+        return qs
 
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
+    form = AdminChangeForm
+    add_form = AdminCreationForm
     list_display = ('email', 'name', 'is_active', 'is_staff', 'date_joined')
     list_filter = ('is_active', 'is_staff')
     search_fields = ('email', 'name')
+    show_full_result_count = False
     ordering = ('-date_joined',)
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
@@ -50,7 +80,9 @@ class OrderAdmin(admin.ModelAdmin):
     list_display = ('id', 'ticket_type', 'owning_user', 'status', 'created_at')
     list_filter = ('ticket_type__event', 'ticket_type', 'status')
     search_fields = ('owning_user__email', 'purchasing_user__email')
+    show_full_result_count = False
     ordering = ('-created_at',)
+    list_select_related = ('ticket_type', 'ticket_type__event', 'owning_user', 'purchasing_user')
 
 
 @admin.register(Transfer)
@@ -58,12 +90,9 @@ class TransferAdmin(admin.ModelAdmin):
     list_display = ('id', 'order', 'from_user', 'to_email', 'status', 'created_at')
     list_filter = ('status',)
     search_fields = ('from_user__email', 'to_email')
+    show_full_result_count = False
     ordering = ('-created_at',)
-
-
-class ShiftInline(admin.TabularInline):
-    model = Shift
-    extra = 1
+    list_select_related = ('order__ticket_type__event', 'order__owning_user', 'from_user', 'to_user')
 
 
 @admin.register(Role)
@@ -72,114 +101,131 @@ class RoleAdmin(admin.ModelAdmin):
     list_filter = ('event',)
     search_fields = ('name',)
     ordering = ('event', 'name')
-    inlines = [ShiftInline]
-    filter_horizontal = ('leads',)
+    list_select_related = ('event',)
+    readonly_fields = ('shifts_link',)
+    autocomplete_fields = ('leads',)
+
+    def shifts_link(self, obj):
+        # Linking out keeps the change form light for roles with many shifts
+        if obj.pk is None:
+            return '-'
+        return format_html(
+            '<a href="{}?role__id__exact={}">View shifts</a> &middot; <a href="{}?role={}">Add shift</a>',
+            reverse('admin:core_shift_changelist'), obj.pk,
+            reverse('admin:core_shift_add'), obj.pk,
+        )
+    shifts_link.short_description = 'Shifts'
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _is_changelist(request):
+            qs = qs.defer('description')
+        return qs
+
+
+def _led_role_ids(request):
+    """Return the IDs of roles led by the requesting user, cached on the request."""
+    if not hasattr(request, '_led_role_ids'):
+        request._led_role_ids = set(request.user.led_roles.values_list('id', flat=True))
+    return request._led_role_ids
+
+
+class LeadFilteredAdminMixin:
+    """Grant access to superusers and to leads of the role an object belongs to.
+
+    Admins using this define `_obj_role_id(obj)` to return the object's role ID.
+    """
+
+    def _has_lead_permission(self, request, obj=None):
+        if request.user.is_superuser:
+            return True
+        led = _led_role_ids(request)
+        if obj is None:
+            return bool(led)
+        return self._obj_role_id(obj) in led
 
-class ShiftAssignmentInline(admin.TabularInline):
+    def has_change_permission(self, request, obj=None):
+        return self._has_lead_permission(request, obj)
+
+    def has_delete_permission(self, request, obj=None):
+        return self._has_lead_permission(request, obj)
+
+    def has_add_permission(self, request):
+        return self._has_lead_permission(request)
+
+    def has_view_permission(self, request, obj=None):
+        return self._has_lead_permission(request, obj)
+
+    def has_module_permission(self, request):
+        return self._has_lead_permission(request)
+
+
+class SuperuserAutocompleteMixin:
+    """Limit autocomplete_fields to superusers."""
+
+    def get_autocomplete_fields(self, request):
+        # Autocomplete is served by the related model's admin, which leads
+        # may not have permission to view, so they keep the filtered selects.
+        if request.user.is_superuser:
+            return super().get_autocomplete_fields(request)
+        return ()
+
+
+class ShiftAssignmentInline(SuperuserAutocompleteMixin, admin.TabularInline):
     model = ShiftAssignment
     extra = 1
+    autocomplete_fields = ('user',)
 
 
 @admin.register(Shift)
-class ShiftAdmin(admin.ModelAdmin):
+class ShiftAdmin(LeadFilteredAdminMixin, SuperuserAutocompleteMixin, admin.ModelAdmin):
     list_display = ('role', 'start_time', 'end_time', 'capacity', 'spots_remaining')
     list_filter = ('role__event', 'role')
+    search_fields = ('role__name',)
     ordering = ('start_time',)
+    list_select_related = ('role', 'role__event')
+    autocomplete_fields = ('role',)
     inlines = [ShiftAssignmentInline]
 
     def spots_remaining(self, obj):
         return obj.spots_remaining
     spots_remaining.short_description = 'Spots Remaining'
+    spots_remaining.admin_order_field = F('capacity') - F('assigned_count')
 
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).select_related('role', 'role__event')
         if request.user.is_superuser:
             return qs
         return qs.filter(role__leads=request.user)
 
-    def has_change_permission(self, request, obj=None):
-        if request.user.is_superuser:
-            return True
-        if obj is not None:
-            return obj.role.leads.filter(pk=request.user.pk).exists()
-        return request.user.led_roles.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        if request.user.is_superuser:
-            return True
-        if obj is not None:
-            return obj.role.leads.filter(pk=request.user.pk).exists()
-        return request.user.led_roles.exists()
-
-    def has_add_permission(self, request):
-        if request.user.is_superuser:
-            return True
-        return request.user.led_roles.exists()
-
-    def has_view_permission(self, request, obj=None):
-        if request.user.is_superuser:
-            return True
-        if obj is not None:
-            return obj.role.leads.filter(pk=request.user.pk).exists()
-        return request.user.led_roles.exists()
-
-    def has_module_permission(self, request):
-        if request.user.is_superuser:
-            return True
-        return request.user.led_roles.exists()
+    def _obj_role_id(self, obj):
+        return obj.role_id
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == 'role' and not request.user.is_superuser:
-            kwargs['queryset'] = Role.objects.filter(leads=request.user)
+            kwargs['queryset'] = Role.objects.filter(leads=request.user).select_related('event')
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(ShiftAssignment)
-class ShiftAssignmentAdmin(admin.ModelAdmin):
+class ShiftAssignmentAdmin(LeadFilteredAdminMixin, SuperuserAutocompleteMixin, admin.ModelAdmin):
     list_display = ('user', 'shift', 'created_at')
     list_filter = ('shift__role__event', 'shift__role')
     search_fields = ('user__email', 'user__name')
     ordering = ('shift__start_time',)
+    list_select_related = ('user', 'shift__role__event')
+    autocomplete_fields = ('shift', 'user')
 
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).select_related('shift__role__event', 'user')
         if request.user.is_superuser:
             return qs
         return qs.filter(shift__role__leads=request.user)
 
-    def has_change_permission(self, request, obj=None):
-        if request.user.is_superuser:
-            return True
-        if obj is not None:
-            return obj.shift.role.leads.filter(pk=request.user.pk).exists()
-        return request.user.led_roles.exists()
-
-    def has_delete_permission(self, request, obj=None):
-        if request.user.is_superuser:
-            return True
-        if obj is not None:
-            return obj.shift.role.leads.filter(pk=request.user.pk).exists()
-        return request.user.led_roles.exists()
-
-    def has_add_permission(self, request):
-        if request.user.is_superuser:
-            return True
-        return request.user.led_roles.exists()
-
-    def has_view_permission(self, request, obj=None):
-        if request.user.is_superuser:
-            return True
-        if obj is not None:
-            return obj.shift.role.leads.filter(pk=request.user.pk).exists()
-        return request.user.led_roles.exists()
-
-    def has_module_permission(self, request):
-        if request.user.is_superuser:
-            return True
-        return request.user.led_roles.exists()
+    def _obj_role_id(self, obj):
+        return obj.shift.role_id
 
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         if db_field.name == 'shift' and not request.user.is_superuser:
-            kwargs['queryset'] = Shift.objects.filter(role__leads=request.user)
+            kwargs['queryset'] = Shift.objects.filter(role__leads=request.user).select_related('role')
         return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -7,6 +7,8 @@ class CoreConfig(AppConfig):
     def ready(self):
         from django.conf import settings
 
+        from . import signals  # noqa: F401
+
         # Only auto-start reconciliation in production (database backend)
         if settings.DEBUG:
             return
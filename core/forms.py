@@ -1,9 +1,23 @@
-from django.contrib.auth.forms import UserCreationForm
+from django.contrib.auth.forms import AdminUserCreationForm, UserChangeForm, UserCreationForm
+from django.core.exceptions import ValidationError
 
 from .models import User
 
 
-class CustomUserCreationForm(UserCreationForm):
+class EmailNormalizationMixin:
+    """Lowercase the email and reject addresses that differ from another user's only in case."""
+
+    def clean_email(self):
+        email = self.cleaned_data.get('email')
+        if not email:
+            return email
+        email = email.lower()
+        if User.objects.filter(email__iexact=email).exclude(pk=self.instance.pk).exists():
+            raise ValidationError(self.instance.unique_error_message(User, ['email']))
+        return email
+
+
+class CustomUserCreationForm(EmailNormalizationMixin, UserCreationForm):
     class Meta:
         model = User
         fields = ('email', 'name', 'password1', 'password2')
@@ -14,3 +28,15 @@ class CustomUserCreationForm(UserCreationForm):
         for field_name, field in self.fields.items():
             field.widget.attrs['class'] = 'form-control'
             field.widget.attrs['placeholder'] = field.label
+
+
+class AdminCreationForm(EmailNormalizationMixin, AdminUserCreationForm):
+    class Meta:
+        model = User
+        fields = ('email', 'name')
+
+
+class AdminChangeForm(EmailNormalizationMixin, UserChangeForm):
+    class Meta:
+        model = User
+        fields = '__all__'
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_order_transfer_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='event',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_active', True)), fields=('is_active',), name='one_active_event', violation_error_message='Only one event can be active at a time. Use the "Make active" action instead.'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+def backfill_assigned_count(apps, schema_editor):
+    Shift = apps.get_model('core', 'Shift')
+    shifts = list(Shift.objects.annotate(count=models.Count('assignments')))
+    for shift in shifts:
+        shift.assigned_count = shift.count
+    Shift.objects.bulk_update(shifts, ['assigned_count'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_event_one_active_constraint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shift',
+            name='assigned_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_assigned_count, migrations.RunPython.noop),
+    ]
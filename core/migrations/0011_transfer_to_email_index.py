@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_shift_assigned_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['to_email', 'status'], name='core_transf_to_emai_574590_idx'),
+        ),
+    ]
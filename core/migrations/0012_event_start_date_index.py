@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_transfer_to_email_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-start_date'], name='core_event_start_d_99e31b_idx'),
+        ),
+    ]
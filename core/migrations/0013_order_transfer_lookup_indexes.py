@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_event_start_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['owning_user', 'status', 'ticket_type'], name='core_order_owning__5afc4a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['stripe_checkout_session_id', 'status'], name='core_order_stripe__aefde6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['from_user', 'status'], name='core_transf_from_us_7836d7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['order', 'status'], name='core_transf_order_i_c912fb_idx'),
+        ),
+    ]
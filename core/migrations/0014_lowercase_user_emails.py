@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-15 22:30
+
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model('core', 'User')
+
+    # Emails that differ only in case would collide on the unique index once
+    # lowercased, so refuse to run until they have been merged by hand
+    collisions = (
+        User.objects.annotate(lowered=Lower('email'))
+        .values('lowered')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('lowered', flat=True)
+    )
+    duplicates = list(
+        User.objects.annotate(lowered=Lower('email'))
+        .filter(lowered__in=collisions)
+        .order_by('lowered', 'id')
+        .values_list('id', 'email')
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Cannot lowercase user emails: these accounts differ only in case. '
+            'Move their orders, transfers and shift assignments onto one account, '
+            'change or delete the others, then run migrate again.\n'
+            + '\n'.join(f'  user {pk}: {email}' for pk, email in duplicates)
+        )
+
+    User.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_order_transfer_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,12 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 
+ACTIVE_EVENT_CACHE_KEY = 'active_event'
+# Invalidation only reaches the process that saved the event when using the
+# default per-process cache, so keep the TTL short to bound staleness elsewhere.
+ACTIVE_EVENT_CACHE_TIMEOUT = 60
+
 
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -17,6 +23,9 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault('is_superuser', True)
         return self.create_user(email, password, **extra_fields)
 
+    def get_by_natural_key(self, username):
+        return super().get_by_natural_key(username.lower())
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(unique=True)
@@ -30,6 +39,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name']
 
+    def save(self, *args, **kwargs):
+        # Store emails lowercase so lookups can match exactly against the unique index
+        self.email = self.email.lower()
+        super().save(*args, **kwargs)
+
 
 class Event(models.Model):
     name = models.CharField(max_length=255)
@@ -43,18 +57,40 @@ class Event(models.Model):
 
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            models.Index(fields=['-start_date']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['is_active'],
+                condition=models.Q(is_active=True),
+                name='one_active_event',
+                violation_error_message='Only one event can be active at a time. Use the "Make active" action instead.',
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
-        if self.is_active:
+    def activate(self):
+        """Make this the only active event."""
+        with transaction.atomic():
             Event.objects.filter(is_active=True).exclude(pk=self.pk).update(is_active=False)
-        super().save(*args, **kwargs)
+            Event.objects.filter(pk=self.pk).update(is_active=True)
+        self.is_active = True
+        Event.clear_active_cache()
 
     @classmethod
     def get_active(cls):
-        return cls.objects.filter(is_active=True).first()
+        return cache.get_or_set(
+            ACTIVE_EVENT_CACHE_KEY,
+            lambda: cls.objects.filter(is_active=True).first(),
+            ACTIVE_EVENT_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def clear_active_cache(cls):
+        cache.delete(ACTIVE_EVENT_CACHE_KEY)
 
 
 class TicketType(models.Model):
@@ -98,6 +134,12 @@ class Order(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['owning_user', 'status', 'ticket_type']),
+            models.Index(fields=['stripe_checkout_session_id', 'status']),
+        ]
 
     def __str__(self):
         return f"Order {self.id} - {self.owning_user.email} - {self.ticket_type.label}"
@@ -121,6 +163,13 @@ class Transfer(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['to_email', 'status']),
+            models.Index(fields=['from_user', 'status']),
+            models.Index(fields=['order', 'status']),
+        ]
 
     def __str__(self):
         return f"Transfer {self.id} - {self.order} -> {self.to_email}"
@@ -148,6 +197,7 @@ class Shift(models.Model):
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     capacity = models.PositiveIntegerField(default=1)
+    assigned_count = models.PositiveIntegerField(default=0, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -159,9 +209,19 @@ class Shift(models.Model):
     def __str__(self):
         return f"{self.role.name} - {self.start_time.strftime('%b %d, %I:%M %p')} to {self.end_time.strftime('%I:%M %p')}"
 
+    def save(self, *args, **kwargs):
+        # assigned_count is only maintained by F() updates from the assignment
+        # signals, so never write back a possibly stale loaded value
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'assigned_count'
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def spots_remaining(self):
-        return self.capacity - self.assignments.count()
+        return self.capacity - self.assigned_count
 
 
 class ShiftAssignment(models.Model):
@@ -0,0 +1,43 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Event, Shift, ShiftAssignment
+
+
+def _adjust_assigned_count(shift_id, delta):
+    Shift.objects.filter(pk=shift_id).update(assigned_count=F('assigned_count') + delta)
+
+
+@receiver(pre_save, sender=ShiftAssignment)
+def remember_previous_shift(sender, instance, raw, **kwargs):
+    """Record the shift an existing assignment is being moved away from."""
+    if raw or instance._state.adding:
+        return
+    instance._previous_shift_id = (
+        ShiftAssignment.objects.filter(pk=instance.pk).values_list('shift_id', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=ShiftAssignment)
+def increment_assigned_count(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    if created:
+        _adjust_assigned_count(instance.shift_id, 1)
+        return
+    previous_shift_id = getattr(instance, '_previous_shift_id', None)
+    if previous_shift_id is not None and previous_shift_id != instance.shift_id:
+        _adjust_assigned_count(previous_shift_id, -1)
+        _adjust_assigned_count(instance.shift_id, 1)
+
+
+@receiver(post_delete, sender=ShiftAssignment)
+def decrement_assigned_count(sender, instance, **kwargs):
+    _adjust_assigned_count(instance.shift_id, -1)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def clear_active_event_cache(sender, **kwargs):
+    Event.clear_active_cache()
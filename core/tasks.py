@@ -11,10 +11,42 @@ from .models import Order
 logger = logging.getLogger(__name__)
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
+# Retry connection errors, 409s, 5xx responses and anything Stripe marks as
+# safe to retry, with the client's built-in backoff. Plain 429s are not
+# retried by the client.
+stripe.max_network_retries = 3
 
 RECONCILIATION_INTERVAL_MINUTES = 10
 
 
+def complete_paid_session(session):
+    """Mark the pending orders for a paid Checkout Session as completed."""
+    return Order.objects.filter(
+        stripe_checkout_session_id=session.id,
+        status='pending',
+    ).update(
+        status='completed',
+        stripe_payment_intent_id=session.payment_intent,
+    )
+
+
+@task
+def finalize_checkout_session(session_id):
+    """
+    Complete the pending orders for a Checkout Session if Stripe reports it paid.
+
+    Enqueued from the checkout success page so that the Stripe round trip
+    happens off the request thread.
+    """
+    session = stripe.checkout.Session.retrieve(session_id)
+    if session.payment_status != 'paid':
+        return 0
+
+    updated = complete_paid_session(session)
+    logger.info(f"Finalized session {session_id} - marked {updated} orders as completed")
+    return updated
+
+
 @task
 def reconcile_pending_orders(max_age_minutes=60):
     """
@@ -41,13 +73,7 @@ def reconcile_pending_orders(max_age_minutes=60):
             session = stripe.checkout.Session.retrieve(session_id)
 
             if session.payment_status == 'paid':
-                updated = Order.objects.filter(
-                    stripe_checkout_session_id=session_id,
-                    status='pending',
-                ).update(
-                    status='completed',
-                    stripe_payment_intent_id=session.payment_intent,
-                )
+                updated = complete_paid_session(session)
                 reconciled += updated
                 logger.info(f"Reconciled session {session_id} - marked {updated} orders as completed")
             elif session.status == 'expired':
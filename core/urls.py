@@ -39,6 +39,7 @@ urlpatterns = [
     path('checkout/create-session/', views.create_checkout_session, name='create_checkout_session'),
     path('checkout/success/', views.checkout_success, name='checkout_success'),
     path('checkout/cancel/', views.checkout_cancel, name='checkout_cancel'),
+    path('checkout/webhook/', views.stripe_webhook, name='stripe_webhook'),
 
     # Ticket management
     path('my-tickets/', views.my_tickets, name='my_tickets'),
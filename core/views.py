@@ -1,5 +1,8 @@
 import base64
 import io
+import time
+from datetime import timedelta
+from functools import wraps
 from urllib.parse import quote
 
 import qrcode
@@ -9,16 +12,75 @@ from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
 from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Q
 
 from .forms import CustomUserCreationForm
 from .models import Event, Order, Transfer, User, Role, Shift, ShiftAssignment
+from .tasks import complete_paid_session, finalize_checkout_session
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
 
+HOUR = timedelta(hours=1)
+
+# Attempts at creating a Checkout Session while Stripe responds with 429
+STRIPE_RATE_LIMIT_ATTEMPTS = 4
+
+
+def rate_limit(limit, period=60):
+    """Allow each user at most `limit` calls to the decorated view per `period` seconds."""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            key = f'rate_limit:{view_func.__name__}:{request.user.pk}'
+            cache.add(key, 0, period)
+            try:
+                count = cache.incr(key)
+            except ValueError:
+                # The window expired between add() and incr()
+                cache.set(key, 1, period)
+                count = 1
+            if count > limit:
+                return HttpResponse('Too many requests. Please wait a minute and try again.', status=429)
+            return view_func(request, *args, **kwargs)
+        return wrapped
+    return decorator
+
+
+def _create_checkout_session(**params):
+    """Create a Stripe Checkout Session, backing off exponentially on rate limits."""
+    for attempt in range(STRIPE_RATE_LIMIT_ATTEMPTS):
+        try:
+            return stripe.checkout.Session.create(**params)
+        except stripe.error.RateLimitError:
+            if attempt == STRIPE_RATE_LIMIT_ATTEMPTS - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+
+
+def _error_response(request, message, redirect_to):
+    """Return a JSON error to AJAX callers, or flash the message and redirect."""
+    if (request.headers.get('x-requested-with') == 'XMLHttpRequest'
+            or 'application/json' in request.headers.get('accept', '')):
+        return JsonResponse({'error': message}, status=400)
+    messages.error(request, message)
+    return redirect(redirect_to)
+
+
+def _floor_hour(dt):
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(dt):
+    hour = _floor_hour(dt)
+    return hour + HOUR if dt > hour else hour
+
 
 def home(request):
     return render(request, 'core/index.html')
@@ -45,6 +107,17 @@ def principles(request):
     return render(request, 'core/principles.html')
 
 
+def _existing_counts(event, user):
+    """Return {ticket_type_id: count} of the user's completed and pending orders for the event."""
+    return dict(
+        Order.objects.filter(
+            ticket_type__event=event,
+            owning_user=user,
+            status__in=['completed', 'pending'],
+        ).values_list('ticket_type_id').annotate(count=Count('id'))
+    )
+
+
 @login_required
 def tickets(request):
     """Display ticket selection page."""
@@ -53,13 +126,7 @@ def tickets(request):
         messages.error(request, 'No active event. Ticket sales are currently closed.')
         return redirect('home')
 
-    existing_counts = dict(
-        Order.objects.filter(
-            ticket_type__event=event,
-            owning_user=request.user,
-            status__in=['completed', 'pending'],
-        ).values_list('ticket_type_id').annotate(count=Count('id'))
-    )
+    existing_counts = _existing_counts(event, request.user)
     ticket_data = []
     for ticket_type in event.ticket_types.all():
         existing = existing_counts.get(ticket_type.id, 0)
@@ -76,17 +143,18 @@ def tickets(request):
 
 @login_required
 @require_POST
+@rate_limit(10)
 def create_checkout_session(request):
     """Create a Stripe Checkout session and redirect to it."""
     event = Event.get_active()
     if not event:
-        messages.error(request, 'No active event. Ticket sales are currently closed.')
-        return redirect('home')
+        return _error_response(request, 'No active event. Ticket sales are currently closed.', 'home')
 
+    ticket_types = list(event.ticket_types.all())
     line_items = []
     tickets_to_create = []
 
-    for ticket_type in event.ticket_types.all():
+    for ticket_type in ticket_types:
         quantity = int(request.POST.get(f'quantity_{ticket_type.id}', 0))
         if quantity > 0:
             line_items.append({
@@ -97,36 +165,29 @@ def create_checkout_session(request):
                 tickets_to_create.append(ticket_type)
 
     if not line_items:
-        messages.error(request, 'Please select at least one ticket.')
-        return redirect('tickets')
+        return _error_response(request, 'Please select at least one ticket.', 'tickets')
 
     # Check ticket limits per user for this event
-    existing_counts = dict(
-        Order.objects.filter(
-            ticket_type__event=event,
-            owning_user=request.user,
-            status__in=['completed', 'pending'],
-        ).values('ticket_type_id').annotate(count=Count('id')).values_list('ticket_type_id', 'count')
-    )
+    existing_counts = _existing_counts(event, request.user)
 
     requested_counts = {}
     for ticket_type in tickets_to_create:
         requested_counts[ticket_type.id] = requested_counts.get(ticket_type.id, 0) + 1
 
-    for ticket_type in event.ticket_types.all():
+    for ticket_type in ticket_types:
         existing = existing_counts.get(ticket_type.id, 0)
         requested = requested_counts.get(ticket_type.id, 0)
         if existing + requested > ticket_type.max_per_user:
             remaining = max(0, ticket_type.max_per_user - existing)
-            messages.error(
+            return _error_response(
                 request,
                 f'You can only have {ticket_type.max_per_user} {ticket_type.label.lower()}s. '
-                f'You already have {existing}, so you can only purchase {remaining} more.'
+                f'You already have {existing}, so you can only purchase {remaining} more.',
+                'tickets',
             )
-            return redirect('tickets')
 
     # Create Stripe Checkout session
-    checkout_session = stripe.checkout.Session.create(
+    checkout_session = _create_checkout_session(
         payment_method_types=['card'],
         line_items=line_items,
         mode='payment',
@@ -139,39 +200,59 @@ def create_checkout_session(request):
     )
 
     # Create pending orders (one per ticket)
-    for ticket_type in tickets_to_create:
-        Order.objects.create(
-            ticket_type=ticket_type,
-            purchasing_user=request.user,
-            owning_user=request.user,
-            stripe_checkout_session_id=checkout_session.id,
-            status='pending',
-        )
+    with transaction.atomic():
+        Order.objects.bulk_create([
+            Order(
+                ticket_type=ticket_type,
+                purchasing_user=request.user,
+                owning_user=request.user,
+                stripe_checkout_session_id=checkout_session.id,
+                status='pending',
+            )
+            for ticket_type in tickets_to_create
+        ], batch_size=500)
 
     return redirect(checkout_session.url)
 
 
 @login_required
+@rate_limit(10)
 def checkout_success(request):
     """Handle successful checkout."""
     session_id = request.GET.get('session_id')
-    if session_id:
-        try:
-            session = stripe.checkout.Session.retrieve(session_id)
-            if session.payment_status == 'paid':
-                Order.objects.filter(
-                    stripe_checkout_session_id=session_id,
-                    status='pending',
-                ).update(
-                    status='completed',
-                    stripe_payment_intent_id=session.payment_intent,
-                )
-        except Exception:
-            pass
+    if session_id and Order.objects.filter(
+        stripe_checkout_session_id=session_id,
+        purchasing_user=request.user,
+        status='pending',
+    ).exists():
+        finalize_checkout_session.enqueue(session_id)
 
     return render(request, 'core/checkout_success.html')
 
 
+@csrf_exempt
+@require_POST
+def stripe_webhook(request):
+    """Receive Stripe events and complete the orders for paid checkouts."""
+    try:
+        stripe_event = stripe.Webhook.construct_event(
+            request.body,
+            request.headers.get('Stripe-Signature', ''),
+            settings.STRIPE_WEBHOOK_SECRET,
+        )
+    except (ValueError, stripe.error.SignatureVerificationError):
+        return HttpResponse(status=400)
+
+    if stripe_event['type'] in ('checkout.session.completed', 'checkout.session.async_payment_succeeded'):
+        # The signed event carries the session itself, so there is no need to
+        # fetch it from Stripe again
+        session = stripe_event['data']['object']
+        if session.payment_status == 'paid':
+            complete_paid_session(session)
+
+    return HttpResponse(status=200)
+
+
 @login_required
 def checkout_cancel(request):
     """Handle cancelled checkout."""
@@ -189,21 +270,18 @@ def my_tickets(request):
         status='completed',
     ).select_related('ticket_type', 'purchasing_user') if event else Order.objects.none()
 
-    outgoing_transfers = Transfer.objects.filter(
-        order__ticket_type__event=event,
-        from_user=request.user,
-        status='pending',
-    ).select_related('order__ticket_type') if event else Transfer.objects.none()
-
-    incoming_transfers = Transfer.objects.filter(
+    # Fetch outgoing and incoming transfers together and split them in Python
+    transfers = Transfer.objects.filter(
+        Q(from_user=request.user) | Q(to_email=request.user.email),
         order__ticket_type__event=event,
-        to_email=request.user.email,
         status='pending',
     ).select_related('order__ticket_type', 'from_user') if event else Transfer.objects.none()
+    outgoing_transfers = [t for t in transfers if t.from_user_id == request.user.id]
+    incoming_transfers = [t for t in transfers if t.to_email == request.user.email]
 
     # Generate QR code with user's email if they have tickets
     qr_code_data_url = None
-    if owned_tickets.exists():
+    if owned_tickets:
         qr = qrcode.make(request.build_absolute_uri('/checkin?email=' + quote(request.user.email)))
         buffer = io.BytesIO()
         qr.save(buffer, format='PNG')
@@ -221,44 +299,42 @@ def my_tickets(request):
 
 @login_required
 @require_POST
+@rate_limit(10)
 def transfer_ticket(request, order_id):
     """Initiate a ticket transfer."""
-    order = get_object_or_404(Order, id=order_id, owning_user=request.user, status='completed')
+    order = get_object_or_404(
+        Order.objects.select_related('ticket_type'),
+        id=order_id,
+        owning_user=request.user,
+        status='completed',
+    )
 
     # Check if there's already a pending transfer for this order
     if Transfer.objects.filter(order=order, status='pending').exists():
-        messages.error(request, 'This ticket already has a pending transfer.')
-        return redirect('my_tickets')
+        return _error_response(request, 'This ticket already has a pending transfer.', 'my_tickets')
 
     to_email = request.POST.get('to_email', '').strip().lower()
     if not to_email:
-        messages.error(request, 'Please enter an email address.')
-        return redirect('my_tickets')
+        return _error_response(request, 'Please enter an email address.', 'my_tickets')
 
     if to_email == request.user.email:
-        messages.error(request, 'You cannot transfer a ticket to yourself.')
-        return redirect('my_tickets')
+        return _error_response(request, 'You cannot transfer a ticket to yourself.', 'my_tickets')
 
     # Check if recipient exists
-    to_user = User.objects.filter(email=to_email).first()
+    to_user = User.objects.only('id', 'email').filter(email=to_email).first()
     if not to_user:
-        messages.error(request, 'No user found with that email address.')
-        return redirect('my_tickets')
-
-    # Check recipient's ticket limits for this event
-    existing_count = Order.objects.filter(
-        ticket_type=order.ticket_type,
-        owning_user=to_user,
-        status__in=['completed', 'pending'],
-    ).count()
-    pending_transfers = Transfer.objects.filter(
-        to_email=to_email,
-        order__ticket_type=order.ticket_type,
-        status='pending',
-    ).count()
-    if existing_count + pending_transfers >= order.ticket_type.max_per_user:
-        messages.error(request, 'The recipient has reached their limit for this ticket type.')
-        return redirect('my_tickets')
+        return _error_response(request, 'No user found with that email address.', 'my_tickets')
+
+    # Check recipient's ticket limits for this event, counting tickets they
+    # own and tickets already pending transfer to them in one query
+    owned = Q(owning_user=to_user, status__in=['completed', 'pending'])
+    incoming = Q(transfers__to_email=to_email, transfers__status='pending')
+    counts = Order.objects.filter(owned | incoming, ticket_type=order.ticket_type).aggregate(
+        existing_count=Count('id', filter=owned, distinct=True),
+        pending_transfers=Count('transfers', filter=incoming, distinct=True),
+    )
+    if counts['existing_count'] + counts['pending_transfers'] >= order.ticket_type.max_per_user:
+        return _error_response(request, 'The recipient has reached their limit for this ticket type.', 'my_tickets')
 
     Transfer.objects.create(
         order=order,
@@ -273,10 +349,11 @@ def transfer_ticket(request, order_id):
 
 @login_required
 @require_POST
+@rate_limit(10)
 def accept_transfer(request, transfer_id):
     """Accept an incoming transfer."""
     transfer = get_object_or_404(
-        Transfer,
+        Transfer.objects.select_related('order__ticket_type'),
         id=transfer_id,
         to_email=request.user.email,
         status='pending',
@@ -289,16 +366,15 @@ def accept_transfer(request, transfer_id):
         status__in=['completed', 'pending'],
     ).count()
     if existing_count >= transfer.order.ticket_type.max_per_user:
-        messages.error(request, 'You have reached your limit for this ticket type.')
-        return redirect('my_tickets')
+        return _error_response(request, 'You have reached your limit for this ticket type.', 'my_tickets')
 
     # Complete the transfer
     transfer.order.owning_user = request.user
-    transfer.order.save()
+    transfer.order.save(update_fields=['owning_user', 'updated_at'])
 
     transfer.to_user = request.user
     transfer.status = 'accepted'
-    transfer.save()
+    transfer.save(update_fields=['to_user', 'status', 'updated_at'])
 
     messages.success(request, 'Transfer accepted. The ticket is now yours.')
     return redirect('my_tickets')
@@ -316,7 +392,7 @@ def reject_transfer(request, transfer_id):
     )
 
     transfer.status = 'rejected'
-    transfer.save()
+    transfer.save(update_fields=['status', 'updated_at'])
 
     messages.success(request, 'Transfer rejected.')
     return redirect('my_tickets')
@@ -339,35 +415,34 @@ def rescind_transfer(request, transfer_id):
     return redirect('my_tickets')
 
 
+def _shift_eligibility(event, user):
+    """Return (has_ticket, shift_count) for the user at the event in one query."""
+    return User.objects.filter(pk=user.pk).annotate(
+        has_ticket=Exists(Order.objects.filter(
+            ticket_type__event=event,
+            owning_user=OuterRef('pk'),
+            status='completed',
+        )),
+        shift_count=Count('shift_assignments', filter=Q(shift_assignments__shift__role__event=event)),
+    ).values_list('has_ticket', 'shift_count').get()
+
+
 @login_required
 def shifts(request):
     """Display shift signup page with a table of roles and hours."""
-    from datetime import timedelta
-
     event = Event.get_active()
     if not event:
         messages.error(request, 'No active event.')
         return redirect('home')
 
-    roles = Role.objects.filter(event=event).prefetch_related(
+    roles = list(Role.objects.filter(event=event).prefetch_related(
         'shifts__assignments__user'
-    )
+    ))
 
-    # Check if user has a ticket for this event
-    has_ticket = Order.objects.filter(
-        ticket_type__event=event,
-        owning_user=request.user,
-        status='completed',
-    ).exists()
-
-    # Count user's current shifts for this event
-    user_shift_count = ShiftAssignment.objects.filter(
-        user=request.user,
-        shift__role__event=event
-    ).count()
+    has_ticket, user_shift_count = _shift_eligibility(event, request.user)
     can_signup_more = event.max_shifts_per_user == 0 or user_shift_count < event.max_shifts_per_user
 
-    if not roles.exists():
+    if not roles:
         return render(request, 'core/shifts.html', {
             'event': event,
             'roles': [],
@@ -378,10 +453,10 @@ def shifts(request):
             'can_signup_more': can_signup_more,
         })
 
-    # Collect all shifts and find time boundaries
-    all_shifts = Shift.objects.filter(role__event=event).select_related('role').prefetch_related('assignments__user')
+    # Collect all shifts from the prefetched roles and find time boundaries
+    all_shifts = [shift for role in roles for shift in role.shifts.all()]
 
-    if not all_shifts.exists():
+    if not all_shifts:
         return render(request, 'core/shifts.html', {
             'event': event,
             'roles': roles,
@@ -392,35 +467,13 @@ def shifts(request):
             'can_signup_more': can_signup_more,
         })
 
-    min_time = min(s.start_time for s in all_shifts)
-    max_time = max(s.end_time for s in all_shifts)
-
     # Round to hour boundaries
-    min_hour = min_time.replace(minute=0, second=0, microsecond=0)
-    max_hour = max_time.replace(minute=0, second=0, microsecond=0)
-    if max_time > max_hour:
-        max_hour += timedelta(hours=1)
+    min_hour = _floor_hour(min(s.start_time for s in all_shifts))
+    max_hour = _ceil_hour(max(s.end_time for s in all_shifts))
 
     # Build list of hours
-    hours = []
-    current = min_hour
-    while current < max_hour:
-        hours.append(current)
-        current += timedelta(hours=1)
-
-    # Build a mapping of (role_id, hour) -> shift for quick lookup
-    # A shift covers all hours from start to end
-    role_hour_shift = {}
-    for shift in all_shifts:
-        shift_start_hour = shift.start_time.replace(minute=0, second=0, microsecond=0)
-        shift_end_hour = shift.end_time.replace(minute=0, second=0, microsecond=0)
-        if shift.end_time > shift_end_hour:
-            shift_end_hour += timedelta(hours=1)
-
-        current = shift_start_hour
-        while current < shift_end_hour:
-            role_hour_shift[(shift.role_id, current)] = shift
-            current += timedelta(hours=1)
+    n_hours = (max_hour - min_hour) // HOUR
+    hours = [min_hour + i * HOUR for i in range(n_hours)]
 
     # Get user's current assignments
     user_assignments = set(
@@ -430,37 +483,48 @@ def shifts(request):
         ).values_list('shift_id', flat=True)
     )
 
-    # Build the grid
-    # Each row is an hour, each cell is either:
+    # A shift covers all hours from its start hour up to its (rounded up) end
+    # hour, stored as integer offsets into `hours`
+    shift_bounds = {}
+    for shift in all_shifts:
+        start = (_floor_hour(shift.start_time) - min_hour) // HOUR
+        end = (_ceil_hour(shift.end_time) - min_hour) // HOUR
+        shift_bounds[shift.id] = (start, end)
+
+    # Build one column of cells per role. Each hour belongs to the
+    # latest-starting shift covering it, so a shift nested inside a longer
+    # one hands the remaining hours back to the outer shift. Each cell is either:
     # - {'type': 'empty'} - no shift
     # - {'type': 'shift_start', 'shift': shift, 'rowspan': N, 'is_signed_up': bool} - start of a shift
     # - {'type': 'shift_continue'} - continuation (skip rendering)
-    grid = []
-    for hour in hours:
-        row = {'hour': hour, 'cells': []}
-        for role in roles:
-            shift = role_hour_shift.get((role.id, hour))
-            if shift is None:
-                row['cells'].append({'type': 'empty'})
-            else:
-                # Check if this is the start hour of the shift
-                shift_start_hour = shift.start_time.replace(minute=0, second=0, microsecond=0)
-                if hour == shift_start_hour:
-                    # Calculate rowspan (number of hours)
-                    shift_end_hour = shift.end_time.replace(minute=0, second=0, microsecond=0)
-                    if shift.end_time > shift_end_hour:
-                        shift_end_hour += timedelta(hours=1)
-                    rowspan = int((shift_end_hour - shift_start_hour).total_seconds() // 3600)
-
-                    row['cells'].append({
-                        'type': 'shift_start',
-                        'shift': shift,
-                        'rowspan': rowspan,
-                        'is_signed_up': shift.id in user_assignments,
-                    })
-                else:
-                    row['cells'].append({'type': 'shift_continue'})
-        grid.append(row)
+    # Cells are read-only in the template, so the empty and continuation
+    # markers are shared.
+    empty = {'type': 'empty'}
+    continuation = {'type': 'shift_continue'}
+    columns = []
+    for role in roles:
+        role_shifts = sorted(role.shifts.all(), key=lambda s: shift_bounds[s.id][0])
+        owners = [None] * n_hours
+        for shift in role_shifts:
+            start, end = shift_bounds[shift.id]
+            owners[start:end] = [shift] * (end - start)
+        column = [empty if owner is None else continuation for owner in owners]
+        for shift in role_shifts:
+            start, end = shift_bounds[shift.id]
+            if start < end and owners[start] is shift:
+                column[start] = {
+                    'type': 'shift_start',
+                    'shift': shift,
+                    'rowspan': end - start,
+                    'is_signed_up': shift.id in user_assignments,
+                }
+        columns.append(column)
+
+    # Each row of the grid is an hour with one cell per role
+    grid = [
+        {'hour': hour, 'cells': [column[i] for column in columns]}
+        for i, hour in enumerate(hours)
+    ]
 
     return render(request, 'core/shifts.html', {
         'event': event,
@@ -479,42 +543,34 @@ def shift_signup(request, shift_id):
     """Sign up for a shift."""
     event = Event.get_active()
     if not event:
-        messages.error(request, 'No active event.')
-        return redirect('home')
+        return _error_response(request, 'No active event.', 'home')
 
-    # Check if user has a ticket for this event
-    has_ticket = Order.objects.filter(
-        ticket_type__event=event,
-        owning_user=request.user,
-        status='completed',
-    ).exists()
+    # Check the user has a ticket and is under the shift limit
+    has_ticket, user_shift_count = _shift_eligibility(event, request.user)
     if not has_ticket:
-        messages.error(request, 'You must have a ticket to sign up for shifts.')
-        return redirect('shifts')
+        return _error_response(request, 'You must have a ticket to sign up for shifts.', 'shifts')
 
-    # Check shift limit
-    if event.max_shifts_per_user > 0:
-        user_shift_count = ShiftAssignment.objects.filter(
-            user=request.user,
-            shift__role__event=event
-        ).count()
-        if user_shift_count >= event.max_shifts_per_user:
-            messages.error(request, f'You have reached the maximum of {event.max_shifts_per_user} shifts.')
-            return redirect('shifts')
+    if event.max_shifts_per_user > 0 and user_shift_count >= event.max_shifts_per_user:
+        return _error_response(request, f'You have reached the maximum of {event.max_shifts_per_user} shifts.', 'shifts')
+
+    with transaction.atomic():
+        # Lock the shift row so concurrent signups for it are serialized
+        shift = get_object_or_404(
+            Shift.objects.select_for_update(of=('self',)).select_related('role'),
+            id=shift_id,
+            role__event=event,
+        )
 
-    shift = get_object_or_404(Shift, id=shift_id, role__event=event)
+        # Check if already signed up
+        if ShiftAssignment.objects.filter(shift=shift, user=request.user).exists():
+            return _error_response(request, 'You are already signed up for this shift.', 'shifts')
 
-    # Check if already signed up
-    if ShiftAssignment.objects.filter(shift=shift, user=request.user).exists():
-        messages.error(request, 'You are already signed up for this shift.')
-        return redirect('shifts')
+        # Check capacity
+        if shift.spots_remaining <= 0:
+            return _error_response(request, 'This shift is full.', 'shifts')
 
-    # Check capacity
-    if shift.spots_remaining <= 0:
-        messages.error(request, 'This shift is full.')
-        return redirect('shifts')
+        ShiftAssignment.objects.create(shift=shift, user=request.user)
 
-    ShiftAssignment.objects.create(shift=shift, user=request.user)
     messages.success(request, f'You have signed up for {shift}.')
     return redirect('shifts')
 
@@ -525,15 +581,13 @@ def shift_cancel(request, shift_id):
     """Cancel shift signup."""
     event = Event.get_active()
     if not event:
-        messages.error(request, 'No active event.')
-        return redirect('home')
+        return _error_response(request, 'No active event.', 'home')
 
-    shift = get_object_or_404(Shift, id=shift_id, role__event=event)
+    shift = get_object_or_404(Shift.objects.select_related('role'), id=shift_id, role__event=event)
 
     assignment = ShiftAssignment.objects.filter(shift=shift, user=request.user).first()
     if not assignment:
-        messages.error(request, 'You are not signed up for this shift.')
-        return redirect('shifts')
+        return _error_response(request, 'You are not signed up for this shift.', 'shifts')
 
     assignment.delete()
     messages.success(request, f'You have cancelled your signup for {shift}.')
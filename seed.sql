@@ -15,24 +15,24 @@ VALUES ((SELECT id FROM core_event WHERE name = 'Coracle 2026'), 'Gate', 'Workin
 
 -- Insert Gate shifts (9am-5pm in 2-hour shifts, capacity 2, for each day of the event)
 -- Nov 12, 2026
-INSERT INTO core_shift (role_id, start_time, end_time, capacity, created_at, updated_at)
+INSERT INTO core_shift (role_id, start_time, end_time, capacity, assigned_count, created_at, updated_at)
 VALUES
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 09:00:00', '2026-11-12 11:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 11:00:00', '2026-11-12 13:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 13:00:00', '2026-11-12 15:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 15:00:00', '2026-11-12 17:00:00', 2, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 09:00:00', '2026-11-12 11:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 11:00:00', '2026-11-12 13:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 13:00:00', '2026-11-12 15:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-12 15:00:00', '2026-11-12 17:00:00', 2, 0, datetime('now'), datetime('now')),
     -- Nov 13, 2026
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 09:00:00', '2026-11-13 11:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 11:00:00', '2026-11-13 13:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 13:00:00', '2026-11-13 15:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 15:00:00', '2026-11-13 17:00:00', 2, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 09:00:00', '2026-11-13 11:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 11:00:00', '2026-11-13 13:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 13:00:00', '2026-11-13 15:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-13 15:00:00', '2026-11-13 17:00:00', 2, 0, datetime('now'), datetime('now')),
     -- Nov 14, 2026
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 09:00:00', '2026-11-14 11:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 11:00:00', '2026-11-14 13:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 13:00:00', '2026-11-14 15:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 15:00:00', '2026-11-14 17:00:00', 2, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 09:00:00', '2026-11-14 11:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 11:00:00', '2026-11-14 13:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 13:00:00', '2026-11-14 15:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-14 15:00:00', '2026-11-14 17:00:00', 2, 0, datetime('now'), datetime('now')),
     -- Nov 15, 2026
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 09:00:00', '2026-11-15 11:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 11:00:00', '2026-11-15 13:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 13:00:00', '2026-11-15 15:00:00', 2, datetime('now'), datetime('now')),
-    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 15:00:00', '2026-11-15 17:00:00', 2, datetime('now'), datetime('now'));
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 09:00:00', '2026-11-15 11:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 11:00:00', '2026-11-15 13:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 13:00:00', '2026-11-15 15:00:00', 2, 0, datetime('now'), datetime('now')),
+    ((SELECT id FROM core_role WHERE name = 'Gate'), '2026-11-15 15:00:00', '2026-11-15 17:00:00', 2, 0, datetime('now'), datetime('now'));